@@ -7,19 +7,122 @@ and compares against authoritative calculations.
 
 import sys
 import json
+import math
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Optional
+from typing import List, Tuple, Optional
 import traceback
+from dataclasses import asdict, dataclass
 import swisseph as swe
 
 # Import the horary engine modules
 from horary_engine.aspects import is_applying_enhanced, is_moon_applying_to_aspect, is_moon_separating_from_aspect
-from horary_engine.models import Planet, Aspect, PlanetPosition
-from horary_engine.utils import degrees_to_sign
+from models import Planet, Aspect, PlanetPosition, Sign
 from horary_config import cfg
 
-def calculate_raw_moon_aspect_status(moon_pos: PlanetPosition, planet_pos: PlanetPosition, aspect_type: Aspect) -> Dict:
-    """Calculate applying/separating status using different methods for comparison"""
+# Major aspects tested against the Moon and the orb used for all of them
+MAJOR_ASPECTS = (Aspect.CONJUNCTION, Aspect.SEXTILE, Aspect.SQUARE, Aspect.TRINE, Aspect.OPPOSITION)
+ASPECT_ORB = 8.0
+
+# Aspects that can be within orb of a separation in [degree, degree + 1), for
+# every whole degree 0-180. Indexing by int(separation) brackets the
+# candidates so out-of-orb (planet, aspect) pairs are never tested.
+_ASPECTS_BY_DEGREE = [
+    tuple(aspect for aspect in MAJOR_ASPECTS
+          if -ASPECT_ORB <= aspect.degrees - degree < ASPECT_ORB + 1)
+    for degree in range(181)
+]
+
+# Signed separations at which each aspect is exact (both directions, both wraps)
+ASPECT_TARGETS = {
+    aspect.degrees: (aspect.degrees, -aspect.degrees, aspect.degrees - 360, -aspect.degrees + 360)
+    for aspect in MAJOR_ASPECTS
+}
+
+# Swiss Ephemeris body ids, resolved once (chart points such as ASC/MC have none)
+SWE_IDS = {
+    planet: getattr(swe, planet.value.upper())
+    for planet in Planet
+    if hasattr(swe, planet.value.upper())
+}
+
+# Sign for every whole degree of longitude; sign boundaries fall on multiples
+# of 30 degrees, so the floor of a longitude is enough to index it
+_SIGN_LUT = [list(Sign)[degree // 30] for degree in range(360)]
+
+def degrees_to_sign(longitude: float) -> Sign:
+    """Zodiac sign containing an ecliptic longitude"""
+    return _SIGN_LUT[math.floor(longitude) % 360]
+
+@dataclass(slots=True)
+class AspectRow:
+    """One Moon-planet aspect from the sweep, with every method's verdict"""
+    aspect_type: str
+    aspect_degrees: int
+    moon_longitude: float
+    planet_longitude: float
+    moon_speed: float
+    planet_speed: float
+    moon_retrograde: bool
+    planet_retrograde: bool
+    current_separation: float
+    orb_from_exact: float
+    current_system_applying: bool
+    moon_specific_applying: bool
+    moon_specific_separating: bool
+    authoritative_applying: bool
+    relative_speed: float
+    will_perfect_in_future: bool
+    scenario: str = ''
+    planet: str = ''
+    julian_day: float = 0.0
+    date_utc: Tuple = ()
+
+def wrap180(x: float) -> float:
+    """Normalize an angle to the -180..+180 range"""
+    return (x + 180.0) % 360.0 - 180.0
+
+def nearest_target(separation: float, aspect_degrees: float) -> float:
+    """Return the exact-aspect separation closest to a signed separation"""
+    t0, t1, t2, t3 = ASPECT_TARGETS[aspect_degrees]
+    d0, d1, d2, d3 = abs(separation - t0), abs(separation - t1), abs(separation - t2), abs(separation - t3)
+    if d0 <= d1 and d0 <= d2 and d0 <= d3:
+        return t0
+    if d1 <= d2 and d1 <= d3:
+        return t1
+    return t2 if d2 <= d3 else t3
+
+def calc_body(jd: float, swe_planet: int) -> Tuple[float, ...]:
+    """Return (lon, lat, dist, speed_lon, speed_lat, speed_dist) for a body"""
+    position, _ = swe.calc_ut(jd, swe_planet, swe.FLG_SPEED)
+    return tuple(position)
+
+def make_planet_position(planet: Planet, row: Tuple[float, ...]) -> PlanetPosition:
+    """Build a PlanetPosition from a calc_body row"""
+    lon, lat, _, speed_lon, _, _ = row
+    return PlanetPosition(
+        planet=planet,
+        longitude=lon,
+        latitude=lat,
+        house=1,  # Placeholder
+        sign=degrees_to_sign(lon),
+        dignity_score=0,  # Placeholder
+        retrograde=(speed_lon < 0 and planet != Planet.MOON),
+        speed=speed_lon
+    )
+
+def calculate_raw_moon_aspect_status(moon_pos: PlanetPosition, planet_pos: PlanetPosition, aspect_type: Aspect,
+                                     signed_sep: Optional[float] = None,
+                                     current_separation: Optional[float] = None,
+                                     orb_from_exact: Optional[float] = None) -> AspectRow:
+    """Calculate applying/separating status using different methods for comparison
+    
+    Callers that already filtered by orb can pass signed_sep (Moon minus
+    planet, normalized to -180..+180), current_separation and orb_from_exact
+    to avoid recomputing them.
+    """
+    if signed_sep is None:
+        signed_sep = wrap180(moon_pos.longitude - planet_pos.longitude)
+    relative_speed = moon_pos.speed - planet_pos.speed
     
     # Method 1: Current system's enhanced logic
     current_applying = is_applying_enhanced(moon_pos, planet_pos, aspect_type, 0.0)
@@ -29,127 +132,90 @@ def calculate_raw_moon_aspect_status(moon_pos: PlanetPosition, planet_pos: Plane
     moon_separating = is_moon_separating_from_aspect(moon_pos, planet_pos, aspect_type, moon_pos.speed)
     
     # Method 3: Authoritative calculation (derivative method)
-    auth_applying = calculate_authoritative_applying(moon_pos, planet_pos, aspect_type)
+    auth_applying = calculate_authoritative_applying(signed_sep, relative_speed, aspect_type.degrees)
     
     # Calculate current angular separation
-    current_separation = abs(moon_pos.longitude - planet_pos.longitude)
-    if current_separation > 180:
-        current_separation = 360 - current_separation
+    if current_separation is None:
+        current_separation = abs(signed_sep)
     
     # Calculate degrees from exact aspect
-    orb_from_exact = abs(current_separation - aspect_type.degrees)
-    
-    return {
-        'aspect_type': aspect_type.name,
-        'aspect_degrees': aspect_type.degrees,
-        'moon_longitude': moon_pos.longitude,
-        'planet_longitude': planet_pos.longitude,
-        'moon_speed': moon_pos.speed,
-        'planet_speed': planet_pos.speed,
-        'moon_retrograde': moon_pos.retrograde,
-        'planet_retrograde': planet_pos.retrograde,
-        'current_separation': current_separation,
-        'orb_from_exact': orb_from_exact,
-        'current_system_applying': current_applying,
-        'moon_specific_applying': moon_applying,
-        'moon_specific_separating': moon_separating,
-        'authoritative_applying': auth_applying,
-        'relative_speed': moon_pos.speed - planet_pos.speed,
-        'will_perfect_in_future': auth_applying
-    }
+    if orb_from_exact is None:
+        orb_from_exact = abs(current_separation - aspect_type.degrees)
+    
+    return AspectRow(
+        aspect_type=aspect_type.name,
+        aspect_degrees=aspect_type.degrees,
+        moon_longitude=moon_pos.longitude,
+        planet_longitude=planet_pos.longitude,
+        moon_speed=moon_pos.speed,
+        planet_speed=planet_pos.speed,
+        moon_retrograde=moon_pos.retrograde,
+        planet_retrograde=planet_pos.retrograde,
+        current_separation=current_separation,
+        orb_from_exact=orb_from_exact,
+        current_system_applying=current_applying,
+        moon_specific_applying=moon_applying,
+        moon_specific_separating=moon_separating,
+        authoritative_applying=auth_applying,
+        relative_speed=relative_speed,
+        will_perfect_in_future=auth_applying
+    )
 
-def calculate_authoritative_applying(moon_pos: PlanetPosition, planet_pos: PlanetPosition, aspect_type: Aspect) -> bool:
+def calculate_authoritative_applying(current_sep: float, relative_speed: float, aspect_deg: float) -> bool:
     """
     Authoritative calculation based on derivative method:
     Applying = angular distance to exact aspect is decreasing
-    """
-    # Current angular separation
-    current_sep = moon_pos.longitude - planet_pos.longitude
-    
-    # Normalize to -180 to +180
-    while current_sep > 180:
-        current_sep -= 360
-    while current_sep < -180:
-        current_sep += 360
-    
-    # Target separations for this aspect (consider both directions)
-    targets = [aspect_type.degrees, -aspect_type.degrees]
-    if aspect_type.degrees != 0 and aspect_type.degrees != 180:
-        targets.extend([aspect_type.degrees - 360, -aspect_type.degrees + 360])
-    
-    # Find closest target
-    closest_target = min(targets, key=lambda t: abs(current_sep - t))
-    current_orb = abs(current_sep - closest_target)
-    
-    # Calculate how orb changes with time (derivative)
-    relative_speed = moon_pos.speed - planet_pos.speed
-    
-    # Future separation after small time increment
-    future_sep = current_sep + relative_speed * 0.1  # 0.1 days forward
-    
-    # Normalize future separation
-    while future_sep > 180:
-        future_sep -= 360
-    while future_sep < -180:
-        future_sep += 360
     
-    future_orb = abs(future_sep - closest_target)
+    Takes plain floats so it has no dependency on PlanetPosition/Aspect:
+    current_sep is Moon minus planet longitude normalized to -180..+180,
+    relative_speed is Moon speed minus planet speed.
+    """
+    # Find closest target for this aspect
+    closest_target = nearest_target(current_sep, aspect_deg)
     
-    # Applying if orb is decreasing
-    return future_orb < current_orb
+    # The orb changes at d(orb)/dt = sign(sep - target) * relative speed, so
+    # it is decreasing (applying) exactly when that product is negative
+    delta = wrap180(current_sep - closest_target)
+    return math.copysign(1.0, delta) * relative_speed < 0
 
-def test_scenario(jd: float, description: str) -> List[Dict]:
-    """Test Moon aspects for a specific Julian Day"""
+def _test_scenario_core(jd: float, description: str) -> List[AspectRow]:
+    """Test Moon aspects for a specific Julian Day
+    
+    Errors propagate to the caller; main() reports them per scenario.
+    """
     results = []
     
-    try:
-        # Calculate planetary positions
-        planets = {}
-        for planet in Planet:
-            if planet == Planet.NORTH_NODE or planet == Planet.SOUTH_NODE:
-                continue
-            
-            swe_planet = getattr(swe, planet.value.upper())
-            lon, lat, dist, speed_lon, speed_lat, speed_dist = swe.calc_ut(jd, swe_planet, swe.FLG_SPEED)
-            
-            planets[planet] = PlanetPosition(
-                longitude=lon,
-                latitude=lat,
-                speed=speed_lon,
-                retrograde=(speed_lon < 0 and planet != Planet.MOON),
-                house=1,  # Placeholder
-                sign=degrees_to_sign(lon),
-                degree_in_sign=lon % 30,
-                dignity_score=0  # Placeholder
-            )
-        
-        moon_pos = planets[Planet.MOON]
-        
-        # Test Moon aspects to each planet
-        for planet, planet_pos in planets.items():
-            if planet == Planet.MOON:
-                continue
-                
-            # Test each major aspect
-            for aspect_type in [Aspect.CONJUNCTION, Aspect.SEXTILE, Aspect.SQUARE, Aspect.TRINE, Aspect.OPPOSITION]:
-                # Calculate current angular separation
-                current_separation = abs(moon_pos.longitude - planet_pos.longitude)
-                if current_separation > 180:
-                    current_separation = 360 - current_separation
-                
-                # Check if aspect is within orb (use 8 degrees for all)
-                orb_from_exact = abs(current_separation - aspect_type.degrees)
-                if orb_from_exact <= 8.0:  # Within orb
-                    result = calculate_raw_moon_aspect_status(moon_pos, planet_pos, aspect_type)
-                    result['scenario'] = description
-                    result['planet'] = planet.value
-                    result['julian_day'] = jd
-                    result['date_utc'] = swe.julday_to_utc(jd, 0)[1:6]  # year, month, day, hour, minute
-                    results.append(result)
-    
-    except Exception as e:
-        print(f"Error in scenario {description}: {e}")
-        traceback.print_exc()
+    # Ephemeris rows for the Moon and every other body, kept as columns
+    moon_row = calc_body(jd, SWE_IDS[Planet.MOON])
+    others = [planet for planet in SWE_IDS if planet != Planet.MOON]
+    rows = [calc_body(jd, SWE_IDS[planet]) for planet in others]
+    
+    # Separation depends only on the planet pair, so compute the signed value
+    # once per planet and reuse it for every candidate aspect
+    signed_seps = [wrap180(moon_row[0] - row[0]) for row in rows]
+    
+    # PlanetPosition objects are only needed by the engine's applying
+    # checks, so build them lazily for planets with an in-orb aspect
+    moon_pos = make_planet_position(Planet.MOON, moon_row)
+    for planet, row, signed_sep in zip(others, rows, signed_seps):
+        current_separation = abs(signed_sep)
+        planet_pos = None
+        for aspect_type in _ASPECTS_BY_DEGREE[int(current_separation)]:
+            orb_from_exact = abs(current_separation - aspect_type.degrees)
+            if orb_from_exact <= ASPECT_ORB:  # Within orb
+                if planet_pos is None:
+                    planet_pos = make_planet_position(planet, row)
+                result = calculate_raw_moon_aspect_status(
+                    moon_pos, planet_pos, aspect_type,
+                    signed_sep=signed_sep,
+                    current_separation=current_separation,
+                    orb_from_exact=orb_from_exact
+                )
+                result.scenario = description
+                result.planet = planet.value
+                result.julian_day = jd
+                result.date_utc = swe.jdut1_to_utc(jd, swe.GREG_CAL)[:5]  # year, month, day, hour, minute
+                results.append(result)
     
     return results
 
@@ -163,31 +229,40 @@ def main():
     
     all_results = []
     
+    # Original chart time (Moon ≈ 29.6° Capricorn)
+    base_jd = swe.julday(1999, 12, 11, 16.166667, swe.GREG_CAL)
+    
     # Test scenarios
     scenarios = [
-        # Original chart scenario (Moon ≈ 29.6° Capricorn)
-        (swe.julday(1999, 12, 11, 16.166667, swe.GREG_CAL), "AE-016 Original Chart"),
+        # Original chart scenario
+        (base_jd, "AE-016 Original Chart"),
         
         # Edge cases
         (swe.julday(2024, 1, 1, 12, swe.GREG_CAL), "New Year 2024"),
         (swe.julday(2024, 6, 15, 12, swe.GREG_CAL), "Mid-year 2024"),
         (swe.julday(2024, 12, 25, 12, swe.GREG_CAL), "Christmas 2024"),
-        
-        # Multiple times for the original chart date (hourly sampling)
     ]
     
-    # Add hourly sampling for original chart date
-    base_jd = swe.julday(1999, 12, 11, 16.166667, swe.GREG_CAL)
-    for hours in range(-12, 13):  # 24 hours around the original time
-        jd = base_jd + hours/24.0
-        scenarios.append((jd, f"AE-016 + {hours:+d}h"))
+    # Hourly sampling for the original chart date, 24 hours around the
+    # original time, generated in one pass
+    scenarios.extend((base_jd + hours / 24.0, f"AE-016 {hours:+d}h") for hours in range(-12, 13))
     
-    # Run all scenarios
-    for jd, description in scenarios:
-        print(f"\n📊 Testing scenario: {description}")
-        scenario_results = test_scenario(jd, description)
-        all_results.extend(scenario_results)
-        print(f"   Found {len(scenario_results)} aspects in orb")
+    # Run all scenarios, streaming each row to disk as JSON Lines so the
+    # dump never has to serialize the whole sweep at once
+    output_file = "moon_aspect_investigation_results.jsonl"
+    with open(output_file, 'w') as f:
+        for jd, description in scenarios:
+            print(f"\n📊 Testing scenario: {description}")
+            try:
+                scenario_results = _test_scenario_core(jd, description)
+            except Exception as e:
+                print(f"Error in scenario {description}: {e}")
+                traceback.print_exc()
+                scenario_results = []
+            all_results.extend(scenario_results)
+            for result in scenario_results:
+                f.write(json.dumps(asdict(result)) + "\n")
+            print(f"   Found {len(scenario_results)} aspects in orb")
     
     # Analysis
     print(f"\n📈 ANALYSIS RESULTS")
@@ -198,16 +273,28 @@ def main():
         print("❌ No aspects found in any scenarios!")
         return
     
-    # Agreement analysis
+    # Agreement analysis; the applying counts and bias counters used in the
+    # bias analysis below are accumulated in the same single pass
     agreements = 0
     disagreements = []
+    total_applying_auth = 0
+    current_says_applying = 0
+    retrograde_issues = 0
+    sign_boundary_issues = 0
     
     for result in all_results:
-        current_vs_auth = result['current_system_applying'] == result['authoritative_applying']
-        if current_vs_auth:
+        auth_applying = result.authoritative_applying
+        current_applying = result.current_system_applying
+        total_applying_auth += auth_applying
+        current_says_applying += current_applying
+        
+        if current_applying == auth_applying:
             agreements += 1
         else:
             disagreements.append(result)
+            retrograde_issues += result.planet_retrograde
+            moon_degree_in_sign = result.moon_longitude % 30
+            sign_boundary_issues += moon_degree_in_sign > 25 or moon_degree_in_sign < 5
     
     accuracy = (agreements / len(all_results)) * 100
     
@@ -218,15 +305,15 @@ def main():
         print("-"*60)
         
         for i, result in enumerate(disagreements[:10]):  # Show first 10 disagreements
-            date_str = f"{result['date_utc'][0]:04d}-{result['date_utc'][1]:02d}-{result['date_utc'][2]:02d} {result['date_utc'][3]:02d}:{result['date_utc'][4]:02d}"
-            print(f"{i+1:2d}. {result['scenario']} | {date_str}")
-            print(f"    Moon {result['aspect_type']} {result['planet']}")
-            print(f"    Current: {'Applying' if result['current_system_applying'] else 'Separating'}")
-            print(f"    Authoritative: {'Applying' if result['authoritative_applying'] else 'Separating'}")
-            print(f"    Moon: {result['moon_longitude']:.2f}° @ {result['moon_speed']:+.3f}°/day")
-            print(f"    {result['planet']}: {result['planet_longitude']:.2f}° @ {result['planet_speed']:+.3f}°/day")
-            print(f"    Relative speed: {result['relative_speed']:+.3f}°/day")
-            print(f"    Orb: {result['orb_from_exact']:.2f}°")
+            date_str = f"{result.date_utc[0]:04d}-{result.date_utc[1]:02d}-{result.date_utc[2]:02d} {result.date_utc[3]:02d}:{result.date_utc[4]:02d}"
+            print(f"{i+1:2d}. {result.scenario} | {date_str}")
+            print(f"    Moon {result.aspect_type} {result.planet}")
+            print(f"    Current: {'Applying' if result.current_system_applying else 'Separating'}")
+            print(f"    Authoritative: {'Applying' if result.authoritative_applying else 'Separating'}")
+            print(f"    Moon: {result.moon_longitude:.2f}° @ {result.moon_speed:+.3f}°/day")
+            print(f"    {result.planet}: {result.planet_longitude:.2f}° @ {result.planet_speed:+.3f}°/day")
+            print(f"    Relative speed: {result.relative_speed:+.3f}°/day")
+            print(f"    Orb: {result.orb_from_exact:.2f}°")
             print()
     
     # Systematic bias analysis
@@ -234,27 +321,16 @@ def main():
     print("-"*40)
     
     # Count by type
-    total_applying_auth = sum(1 for r in all_results if r['authoritative_applying'])
-    total_separating_auth = sum(1 for r in all_results if not r['authoritative_applying'])
-    
-    current_says_applying = sum(1 for r in all_results if r['current_system_applying'])
-    current_says_separating = sum(1 for r in all_results if not r['current_system_applying'])
+    total_separating_auth = len(all_results) - total_applying_auth
+    current_says_separating = len(all_results) - current_says_applying
     
     print(f"Authoritative: {total_applying_auth} applying, {total_separating_auth} separating")
     print(f"Current system: {current_says_applying} applying, {current_says_separating} separating")
     
     # Check for specific biases
-    retrograde_issues = sum(1 for r in disagreements if r['planet_retrograde'])
-    sign_boundary_issues = sum(1 for r in disagreements if (r['moon_longitude'] % 30) > 25 or (r['moon_longitude'] % 30) < 5)
-    
     print(f"Disagreements involving retrograde planets: {retrograde_issues}/{len(disagreements)}")
     print(f"Disagreements near sign boundaries: {sign_boundary_issues}/{len(disagreements)}")
     
-    # Save detailed results
-    output_file = "moon_aspect_investigation_results.json"
-    with open(output_file, 'w') as f:
-        json.dump(all_results, f, indent=2)
-    
     print(f"\n💾 Detailed results saved to: {output_file}")
     print(f"🎯 Investigation complete! Accuracy: {accuracy:.1f}%")
 
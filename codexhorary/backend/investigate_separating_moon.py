@@ -6,31 +6,46 @@ Investigation of Moon aspects marked as "Separating" in actual chart
 import json
 from typing import Dict, Tuple
 
+# Signed separations at which each aspect is exact (both directions, both wraps)
+ASPECT_TARGETS = {
+    degrees: (degrees, -degrees, degrees - 360, -degrees + 360)
+    for degrees in (0, 60, 90, 120, 180)
+}
+
+def wrap180(x: float) -> float:
+    """Normalize an angle to the -180..+180 range"""
+    return (x + 180.0) % 360.0 - 180.0
+
+def nearest_target(separation: float, aspect_degrees: float) -> float:
+    """Return the exact-aspect separation closest to a signed separation"""
+    t0, t1, t2, t3 = ASPECT_TARGETS[aspect_degrees]
+    d0, d1, d2, d3 = abs(separation - t0), abs(separation - t1), abs(separation - t2), abs(separation - t3)
+    if d0 <= d1 and d0 <= d2 and d0 <= d3:
+        return t0
+    if d1 <= d2 and d1 <= d3:
+        return t1
+    return t2 if d2 <= d3 else t3
+
 def analyze_separating_moon_chart():
     """
     Analyze the chart where Moon aspects were marked as separating
     """
     
-    # Extract actual data from the chart where Moon aspects show as separating
-    chart_data = {
-        'moon': {
-            'longitude': 71.57313760021185,  # ~11.6° Gemini
-            'speed': 14.126580400828198,     # degrees/day
-            'sign': 'Gemini'
-        },
-        'mercury': {
-            'longitude': 126.49531162844104, # ~6.5° Leo
-            'speed': 0.730625313029497
-        },
-        'mars': {
-            'longitude': 186.5997697338033,  # ~6.6° Libra  
-            'speed': 0.6337295642879655
-        },
-        'jupiter': {
-            'longitude': 105.12094523832012, # ~15.1° Cancer
-            'speed': 0.19864062305988348
-        }
-    }
+    # Actual data from the chart where Moon aspects show as separating, kept
+    # as parallel columns so separations are computed for all planets at once
+    moon_lon = 71.57313760021185     # ~11.6° Gemini
+    moon_speed = 14.126580400828198  # degrees/day
+    
+    names = ('mercury', 'mars', 'jupiter')
+    longitudes = (
+        126.49531162844104,  # ~6.5° Leo
+        186.5997697338033,   # ~6.6° Libra
+        105.12094523832012,  # ~15.1° Cancer
+    )
+    speeds = (0.730625313029497, 0.6337295642879655, 0.19864062305988348)
+    
+    separations = [abs(moon_lon - planet_lon) for planet_lon in longitudes]
+    separations = [360 - sep if sep > 180 else sep for sep in separations]
     
     # Expected aspects from the JSON:
     # Moon ☍ Mercury: applying=false, orb=5.08° (Sextile)
@@ -38,46 +53,40 @@ def analyze_separating_moon_chart():
     
     print("🔍 SEPARATING MOON ANALYSIS")
     print("="*60)
-    print(f"Moon: {chart_data['moon']['longitude']:.2f}° @ {chart_data['moon']['speed']:+.3f}°/day")
+    print(f"Moon: {moon_lon:.2f}° @ {moon_speed:+.3f}°/day")
     print()
     
     results = []
     
     # Test the specific aspects that were marked as separating
+    # (column index into names/longitudes/speeds, aspect name, degrees)
     test_cases = [
-        ('mercury', 'sextile', 60),
-        ('mars', 'trine', 120)
+        (0, 'sextile', 60),   # Mercury
+        (1, 'trine', 120)     # Mars
     ]
     
-    for planet_name, aspect_name, aspect_degrees in test_cases:
-        planet_data = chart_data[planet_name]
-        
-        print(f"📍 {planet_name.upper()}: {planet_data['longitude']:.2f}° @ {planet_data['speed']:+.3f}°/day")
+    for i, aspect_name, aspect_degrees in test_cases:
+        planet_name = names[i]
+        planet_lon, planet_speed, separation = longitudes[i], speeds[i], separations[i]
         
-        # Calculate angular separation
-        moon_lon = chart_data['moon']['longitude']
-        planet_lon = planet_data['longitude']
-        
-        separation = abs(moon_lon - planet_lon)
-        if separation > 180:
-            separation = 360 - separation
+        print(f"📍 {planet_name.upper()}: {planet_lon:.2f}° @ {planet_speed:+.3f}°/day")
         
         orb = abs(separation - aspect_degrees)
         
         print(f"  {aspect_name.title()}: {orb:.1f}° orb, {separation:.1f}° separation")
         
         # Method 1: Simple future calculation
-        relative_speed = chart_data['moon']['speed'] - planet_data['speed']
+        relative_speed = moon_speed - planet_speed
         
         time_increment = 0.1  # days
-        future_moon = (moon_lon + chart_data['moon']['speed'] * time_increment) % 360
-        future_planet = (planet_lon + planet_data['speed'] * time_increment) % 360
+        future_moon = moon_lon + moon_speed * time_increment
+        future_planet = planet_lon + planet_speed * time_increment
         
-        future_sep = abs(future_moon - future_planet)
-        if future_sep > 180:
-            future_sep = 360 - future_sep
+        # Wrapping the difference folds both % 360 reductions and the
+        # > 180 check into one expression
+        future_sep = abs(wrap180(future_moon - future_planet))
         
-        current_orb = abs(separation - aspect_degrees)
+        current_orb = orb
         future_orb = abs(future_sep - aspect_degrees)
         
         simple_applying = future_orb < current_orb
@@ -86,41 +95,30 @@ def analyze_separating_moon_chart():
         # Based on is_applying_enhanced from aspects.py
         
         # Faster planet applies to slower
-        if abs(chart_data['moon']['speed']) > abs(planet_data['speed']):
+        if abs(moon_speed) > abs(planet_speed):
             faster_lon, slower_lon = moon_lon, planet_lon
-            faster_speed, slower_speed = chart_data['moon']['speed'], planet_data['speed']
+            faster_speed, slower_speed = moon_speed, planet_speed
             faster_name, slower_name = 'Moon', planet_name
         else:
             faster_lon, slower_lon = planet_lon, moon_lon
-            faster_speed, slower_speed = planet_data['speed'], chart_data['moon']['speed']
+            faster_speed, slower_speed = planet_speed, moon_speed
             faster_name, slower_name = planet_name, 'Moon'
         
         # Calculate separation as faster - slower (signed)
         separation_signed = faster_lon - slower_lon
         
         # Normalize to -180 to +180
-        while separation_signed > 180:
-            separation_signed -= 360
-        while separation_signed < -180:
-            separation_signed += 360
-        
-        # Target separations for this aspect
-        targets = [aspect_degrees, -aspect_degrees]
-        if aspect_degrees != 0 and aspect_degrees != 180:
-            targets.extend([aspect_degrees - 360, -aspect_degrees + 360])
-        
-        # Find closest target
-        closest_target = min(targets, key=lambda t: abs(separation_signed - t))
+        separation_signed = wrap180(separation_signed)
+        
+        # Find closest target for this aspect
+        closest_target = nearest_target(separation_signed, aspect_degrees)
         current_orb_enhanced = abs(separation_signed - closest_target)
         
         # Calculate future separation
         future_separation_signed = separation_signed + (faster_speed - slower_speed) * time_increment
         
         # Normalize future separation
-        while future_separation_signed > 180:
-            future_separation_signed -= 360
-        while future_separation_signed < -180:
-            future_separation_signed += 360
+        future_separation_signed = wrap180(future_separation_signed)
         
         future_orb_enhanced = abs(future_separation_signed - closest_target)
         
@@ -7,106 +7,101 @@ Focuses on the core logic without external dependencies
 import json
 from typing import Dict, Tuple
 
+# Signed separations at which each aspect is exact (both directions, both wraps)
+ASPECT_TARGETS = {
+    degrees: (degrees, -degrees, degrees - 360, -degrees + 360)
+    for degrees in (0, 60, 90, 120, 180)
+}
+
+def wrap180(x: float) -> float:
+    """Normalize an angle to the -180..+180 range"""
+    return (x + 180.0) % 360.0 - 180.0
+
+def nearest_target(separation: float, aspect_degrees: float) -> float:
+    """Return the exact-aspect separation closest to a signed separation"""
+    t0, t1, t2, t3 = ASPECT_TARGETS[aspect_degrees]
+    d0, d1, d2, d3 = abs(separation - t0), abs(separation - t1), abs(separation - t2), abs(separation - t3)
+    if d0 <= d1 and d0 <= d2 and d0 <= d3:
+        return t0
+    if d1 <= d2 and d1 <= d3:
+        return t1
+    return t2 if d2 <= d3 else t3
+
 def analyze_aspect_logic():
     """
     Analyze the current Moon aspect logic by examining the code patterns
     and simulating with the actual data from AE-016 chart
     """
     
-    # Extract actual data from AE-016 chart (from the JSON we examined)
-    ae016_data = {
-        'moon': {
-            'longitude': 299.5955885623632,  # ~29.6° Capricorn
-            'speed': 11.93264201061046,      # degrees/day
-            'sign': 'Capricorn'
-        },
-        'mercury': {
-            'longitude': 240.80361806909752, # ~0.8° Sagittarius  
-            'speed': 1.3827145030839942
-        },
-        'venus': {
-            'longitude': 216.69973658110044, # ~6.7° Scorpio
-            'speed': 1.1759101819264413
-        },
-        'mars': {
-            'longitude': 311.8295881367451,  # ~11.8° Aquarius
-            'speed': 0.7726304697588048
-        },
-        'jupiter': {
-            'longitude': 25.14945067035318,  # ~25.1° Aries
-            'speed': -0.031190948543883813   # Retrograde
-        }
-    }
+    # Actual data from AE-016 chart (from the JSON we examined), kept as
+    # parallel columns so separations and orbs are computed for all planets at once
+    moon_lon = 299.5955885623632     # ~29.6° Capricorn
+    moon_speed = 11.93264201061046   # degrees/day
+    
+    names = ('mercury', 'venus', 'mars', 'jupiter')
+    longitudes = (
+        240.80361806909752,  # ~0.8° Sagittarius
+        216.69973658110044,  # ~6.7° Scorpio
+        311.8295881367451,   # ~11.8° Aquarius
+        25.14945067035318,   # ~25.1° Aries
+    )
+    speeds = (
+        1.3827145030839942,
+        1.1759101819264413,
+        0.7726304697588048,
+        -0.031190948543883813,  # Retrograde
+    )
     
     # Define aspects to test
-    aspects = {
-        'sextile': 60,
-        'square': 90, 
-        'trine': 120,
-        'opposition': 180,
-        'conjunction': 0
-    }
+    aspect_names = ('sextile', 'square', 'trine', 'opposition', 'conjunction')
+    aspect_degrees_list = (60, 90, 120, 180, 0)
+    
+    # Signed (Moon - planet) and absolute separation per planet, then the
+    # (planets x aspects) orb matrix
+    signed_separations = [wrap180(moon_lon - planet_lon) for planet_lon in longitudes]
+    separations = [abs(sep) for sep in signed_separations]
+    orbs = [[abs(sep - degrees) for degrees in aspect_degrees_list] for sep in separations]
     
     results = []
     
     print("🔍 MOON ASPECT ANALYSIS - AE-016 Chart")
     print("="*60)
-    print(f"Moon: {ae016_data['moon']['longitude']:.2f}° @ {ae016_data['moon']['speed']:+.3f}°/day")
+    print(f"Moon: {moon_lon:.2f}° @ {moon_speed:+.3f}°/day")
     print()
     
-    # Test each planet
-    for planet_name, planet_data in ae016_data.items():
-        if planet_name == 'moon':
-            continue
-            
-        print(f"📍 {planet_name.upper()}: {planet_data['longitude']:.2f}° @ {planet_data['speed']:+.3f}°/day")
-        
-        # Calculate angular separation
-        moon_lon = ae016_data['moon']['longitude']
-        planet_lon = planet_data['longitude']
+    # Test each planet; the loops only gather and format in-orb cells
+    for planet_name, planet_lon, planet_speed, moon_to_planet, separation, planet_orbs in zip(
+            names, longitudes, speeds, signed_separations, separations, orbs):
+        print(f"📍 {planet_name.upper()}: {planet_lon:.2f}° @ {planet_speed:+.3f}°/day")
         
-        separation = abs(moon_lon - planet_lon)
-        if separation > 180:
-            separation = 360 - separation
+        relative_speed = moon_speed - planet_speed
         
         # Test each aspect
-        for aspect_name, aspect_degrees in aspects.items():
-            orb = abs(separation - aspect_degrees)
-            
+        for aspect_name, aspect_degrees, orb in zip(aspect_names, aspect_degrees_list, planet_orbs):
             if orb <= 8.0:  # Within 8° orb
                 # Calculate applying/separating using different methods
                 
                 # Method 1: Simple relative speed analysis
-                relative_speed = ae016_data['moon']['speed'] - planet_data['speed']
-                
                 # Calculate future positions
                 time_increment = 0.1  # days
-                future_moon = (moon_lon + ae016_data['moon']['speed'] * time_increment) % 360
-                future_planet = (planet_lon + planet_data['speed'] * time_increment) % 360
+                future_moon = moon_lon + moon_speed * time_increment
+                future_planet = planet_lon + planet_speed * time_increment
                 
-                future_sep = abs(future_moon - future_planet)
-                if future_sep > 180:
-                    future_sep = 360 - future_sep
+                # Wrapping the difference folds both % 360 reductions and the
+                # > 180 check into one expression
+                future_sep = abs(wrap180(future_moon - future_planet))
                 
-                current_orb = abs(separation - aspect_degrees)
+                current_orb = orb
                 future_orb = abs(future_sep - aspect_degrees)
                 
                 simple_applying = future_orb < current_orb
                 
                 # Method 2: Derivative approach (more accurate)
                 # Find which direction the Moon is approaching the aspect from
-                moon_to_planet = moon_lon - planet_lon
-                while moon_to_planet > 180:
-                    moon_to_planet -= 360
-                while moon_to_planet < -180:
-                    moon_to_planet += 360
+                # (moon_to_planet is computed once per planet above)
                 
                 # Find closest target for this aspect
-                targets = [aspect_degrees, -aspect_degrees]
-                if aspect_degrees != 0 and aspect_degrees != 180:
-                    targets.extend([aspect_degrees - 360, -aspect_degrees + 360])
-                
-                closest_target = min(targets, key=lambda t: abs(moon_to_planet - t))
+                closest_target = nearest_target(moon_to_planet, aspect_degrees)
                 current_dist = abs(moon_to_planet - closest_target)
                 
                 # Calculate future distance
@@ -118,8 +113,8 @@ def analyze_aspect_logic():
                 # Check what the current system logic would produce
                 # Based on is_applying_enhanced logic
                 current_system_applying = analyze_current_system_logic(
-                    moon_lon, planet_lon, 
-                    ae016_data['moon']['speed'], planet_data['speed'],
+                    moon_to_planet,
+                    moon_speed, planet_speed,
                     aspect_degrees
                 )
                 
@@ -134,8 +129,8 @@ def analyze_aspect_logic():
                     'current_system': current_system_applying,
                     'moon_longitude': moon_lon,
                     'planet_longitude': planet_lon,
-                    'moon_speed': ae016_data['moon']['speed'],
-                    'planet_speed': planet_data['speed']
+                    'moon_speed': moon_speed,
+                    'planet_speed': planet_speed
                 }
                 
                 results.append(result)
@@ -153,48 +148,32 @@ def analyze_aspect_logic():
     
     return results
 
-def analyze_current_system_logic(moon_lon: float, planet_lon: float, 
+def analyze_current_system_logic(moon_to_planet: float,
                                moon_speed: float, planet_speed: float,
                                aspect_degrees: float) -> bool:
     """
     Simulate the current system's is_applying_enhanced logic
+    
+    moon_to_planet is the Moon - planet separation normalized to -180..+180
     """
     
-    # Determine faster/slower planet
+    # Determine faster/slower planet; separation and relative speed are
+    # taken as faster - slower, normalized to -180 to +180
     if abs(moon_speed) > abs(planet_speed):
-        faster_lon, slower_lon = moon_lon, planet_lon
-        faster_speed, slower_speed = moon_speed, planet_speed
+        separation = moon_to_planet
+        relative_speed = moon_speed - planet_speed
     else:
-        faster_lon, slower_lon = planet_lon, moon_lon
-        faster_speed, slower_speed = planet_speed, moon_speed
-    
-    # Calculate separation as faster - slower
-    separation = faster_lon - slower_lon
+        separation = wrap180(-moon_to_planet)
+        relative_speed = planet_speed - moon_speed
     
-    # Normalize to -180 to +180
-    while separation > 180:
-        separation -= 360
-    while separation < -180:
-        separation += 360
+    # Find closest target for this aspect
+    closest_target = nearest_target(separation, aspect_degrees)
     
-    # Find targets for this aspect
-    targets = [aspect_degrees, -aspect_degrees]
-    if aspect_degrees != 0 and aspect_degrees != 180:
-        targets.extend([aspect_degrees - 360, -aspect_degrees + 360])
-    
-    # Find closest target
-    closest_target = min(targets, key=lambda t: abs(separation - t))
     current_orb = abs(separation - closest_target)
     
-    # Calculate future separation
+    # Calculate future separation, normalized to -180 to +180
     time_increment = 0.1  # From config.timing.timing_precision_days
-    future_separation = separation + (faster_speed - slower_speed) * time_increment
-    
-    # Normalize future separation
-    while future_separation > 180:
-        future_separation -= 360
-    while future_separation < -180:
-        future_separation += 360
+    future_separation = wrap180(separation + relative_speed * time_increment)
     
     future_orb = abs(future_separation - closest_target)
     